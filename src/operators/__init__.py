@@ -17,6 +17,17 @@ from .operators_api import (
     Equipment,
     Shift,
 
+    # Record types
+    OperatorRecord,
+    LotRecord,
+    ProductTypeRecord,
+    EquipmentRecord,
+    ShiftRecord,
+
+    # Client
+    AsyncOperatorsClient,
+    SyncOperatorsClient,
+
     # Core API functions
     get_operator_by_id,
     get_all_operators,
@@ -24,17 +35,31 @@ from .operators_api import (
     get_operators_by_department,
     get_operator_by_code,
 
+    # Streaming functions
+    iter_all_operators,
+    iter_operator_lots,
+
     # Utility functions
     get_operator_summary,
+    get_operators_by_ids,
+    get_department_lots,
     search_operators,
     safe_get_operator,
 
+    # Connection and cache management
+    aclose_all,
+    install_uvloop,
+    use_client,
+    invalidate_operator,
+    clear_cache,
+    invalidate_cache,
+
     # Configuration
     DEFAULT_BASE_URL,
+    HTTP_TIMEOUTS,
+    __version__,
 )
 
-__version__ = "1.0.0"
-
 __all__ = [
     # Type definitions
     'Operator',
@@ -43,6 +68,17 @@ __all__ = [
     'Equipment',
     'Shift',
 
+    # Record types
+    'OperatorRecord',
+    'LotRecord',
+    'ProductTypeRecord',
+    'EquipmentRecord',
+    'ShiftRecord',
+
+    # Client
+    'AsyncOperatorsClient',
+    'SyncOperatorsClient',
+
     # Core API functions
     'get_operator_by_id',
     'get_all_operators',
@@ -50,11 +86,26 @@ __all__ = [
     'get_operators_by_department',
     'get_operator_by_code',
 
+    # Streaming functions
+    'iter_all_operators',
+    'iter_operator_lots',
+
     # Utility functions
     'get_operator_summary',
+    'get_operators_by_ids',
+    'get_department_lots',
     'search_operators',
     'safe_get_operator',
 
+    # Connection and cache management
+    'aclose_all',
+    'install_uvloop',
+    'use_client',
+    'invalidate_operator',
+    'clear_cache',
+    'invalidate_cache',
+
     # Configuration
     'DEFAULT_BASE_URL',
+    'HTTP_TIMEOUTS',
 ]
@@ -8,12 +8,60 @@ for use by AI agents in the Solace Agent Mesh framework.
 API Base URL: http://localhost:8080/api/v1
 Database: MariaDB 11.2
 
-Note: All functions are async and must be called with await.
+Note: All functions are async and must be called with await. Requests share a pooled
+HTTP/2 connection per base URL, so independent lookups should be issued concurrently,
+e.g. ``await asyncio.gather(*[get_operator_lots(i) for i in ids])``, to multiplex them
+over a single connection instead of awaiting them one after another.
 """
 
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import hashlib
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import weakref
 import httpx
-from typing import TypedDict, List, Optional, Any, Dict
-from datetime import datetime
+import ijson
+from contextlib import aclosing, contextmanager
+from dataclasses import dataclass
+from typing import TypedDict, List, Any, Dict, Tuple, Callable, Awaitable, AsyncIterator, Iterator, Iterable
+from datetime import date, datetime, timezone
+
+try:
+    # Optional C extension; parses ISO 8601 timestamps ~10x faster than the stdlib
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    _parse_datetime = datetime.fromisoformat
+
+try:
+    # Optional C extension; converts parsed payloads into typed records in C
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    # Optional linear-time (DFA) regex engine, immune to catastrophic backtracking
+    import re2 as _regex_engine
+except ImportError:
+    _regex_engine = re
+
+try:
+    # C extension JSON codec, several times faster than the stdlib on list payloads
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
 
 
 # ============================================================================
@@ -86,55 +134,1101 @@ class Lot(TypedDict, total=False):
     updatedAt: str
 
 
+# ============================================================================
+# Record Types (opt-in via as_objects=True)
+# ============================================================================
+# Slotted, immutable counterparts of the TypedDict schemas above. Records have
+# no per-instance __dict__, so large result sets use considerably less memory
+# than plain dicts and attribute access avoids a hash lookup. Date and datetime
+# fields are parsed once when the record is built, so consumers can sort and
+# compare them directly.
+
+def _record_kwargs(
+    cls: type,
+    data: Dict[str, Any],
+    date_fields: Tuple[str, ...] = (),
+    datetime_fields: Tuple[str, ...] = ("createdAt", "updatedAt")
+) -> Dict[str, Any]:
+    """Select the keys of data that are fields of the record class, parsing temporal values."""
+    field_names = cls.__dataclass_fields__
+    kwargs = {key: value for key, value in data.items() if key in field_names}
+    for key in date_fields:
+        value = kwargs.get(key)
+        if isinstance(value, str):
+            kwargs[key] = date.fromisoformat(value)
+    for key in datetime_fields:
+        value = kwargs.get(key)
+        if isinstance(value, str):
+            kwargs[key] = _parse_datetime(value)
+    return kwargs
+
+
+@dataclass(slots=True, frozen=True)
+class OperatorRecord:
+    """Operator entity record"""
+    operatorId: int | None = None
+    operatorCode: str | None = None
+    operatorName: str | None = None
+    employeeNumber: str | None = None
+    department: str | None = None
+    hireDate: date | None = None
+    email: str | None = None
+    status: str | None = None
+    createdAt: datetime | None = None
+    updatedAt: datetime | None = None
+
+    @classmethod
+    def from_dict(cls, data: Operator) -> "OperatorRecord":
+        return cls(**_record_kwargs(cls, data, date_fields=("hireDate",)))
+
+
+@dataclass(slots=True, frozen=True)
+class ProductTypeRecord:
+    """Product Type entity record"""
+    productTypeId: int | None = None
+    productCode: str | None = None
+    productName: str | None = None
+    productFamily: str | None = None
+    targetYield: float | None = None
+    specificationVersion: str | None = None
+    createdAt: datetime | None = None
+
+    @classmethod
+    def from_dict(cls, data: ProductType) -> "ProductTypeRecord":
+        return cls(**_record_kwargs(cls, data))
+
+
+@dataclass(slots=True, frozen=True)
+class EquipmentRecord:
+    """Equipment entity record"""
+    equipmentId: int | None = None
+    equipmentCode: str | None = None
+    equipmentName: str | None = None
+    equipmentType: str | None = None
+    location: str | None = None
+    manufacturer: str | None = None
+    installDate: date | None = None
+    status: str | None = None
+    createdAt: datetime | None = None
+    updatedAt: datetime | None = None
+
+    @classmethod
+    def from_dict(cls, data: Equipment) -> "EquipmentRecord":
+        return cls(**_record_kwargs(cls, data, date_fields=("installDate",)))
+
+
+@dataclass(slots=True, frozen=True)
+class ShiftRecord:
+    """Shift entity record"""
+    shiftId: int | None = None
+    shiftCode: str | None = None
+    shiftName: str | None = None
+    startTime: str | None = None
+    endTime: str | None = None
+    description: str | None = None
+    createdAt: datetime | None = None
+
+    @classmethod
+    def from_dict(cls, data: Shift) -> "ShiftRecord":
+        return cls(**_record_kwargs(cls, data))
+
+
+@dataclass(slots=True, frozen=True)
+class LotRecord:
+    """Lot entity record"""
+    lotId: int | None = None
+    lotNumber: str | None = None
+    productType: ProductTypeRecord | None = None
+    equipment: EquipmentRecord | None = None
+    operator: OperatorRecord | None = None
+    shift: ShiftRecord | None = None
+    productionStart: datetime | None = None
+    productionEnd: datetime | None = None
+    waferCount: int | None = None
+    status: str | None = None
+    createdAt: datetime | None = None
+    updatedAt: datetime | None = None
+
+    @classmethod
+    def from_dict(cls, data: Lot) -> "LotRecord":
+        kwargs = _record_kwargs(
+            cls, data, datetime_fields=("productionStart", "productionEnd", "createdAt", "updatedAt")
+        )
+        for key, record_cls in (
+            ("productType", ProductTypeRecord),
+            ("equipment", EquipmentRecord),
+            ("operator", OperatorRecord),
+            ("shift", ShiftRecord),
+        ):
+            if kwargs.get(key) is not None:
+                kwargs[key] = record_cls.from_dict(kwargs[key])
+        return cls(**kwargs)
+
+
+def _to_records(items: List[Dict[str, Any]], record_cls: type) -> List[Any]:
+    """
+    Build records from parsed response items.
+
+    Uses msgspec when installed, which validates and converts the whole list
+    (including date/datetime parsing) in C; items it cannot convert fall back
+    to the lenient pure-Python from_dict path.
+    """
+    if msgspec is not None:
+        try:
+            return msgspec.convert(items, List[record_cls], strict=False)
+        except msgspec.ValidationError:
+            pass
+    return [record_cls.from_dict(item) for item in items]
+
+
 # ============================================================================
 # Configuration
 # ============================================================================
 
+_logger = logging.getLogger(__name__)
+
+# Package version, reported to the API in the User-Agent header
+__version__ = "1.0.0"
+
 # Default base URL for the API
 DEFAULT_BASE_URL = "http://localhost:8080/api/v1"
 
+def _skill_timeout(skill: str, seconds: float, connect: float = 2.0) -> httpx.Timeout:
+    """Build a skill's timeout, overridable via the OPERATORS_TIMEOUT_<SKILL> env var (seconds)."""
+    name = f"OPERATORS_TIMEOUT_{skill.upper()}"
+    value = os.environ.get(name)
+    if value is not None:
+        try:
+            seconds = float(value)
+        except ValueError:
+            _logger.warning("Ignoring %s=%r: not a number of seconds, using %s", name, value, seconds)
+    return httpx.Timeout(seconds, connect=connect)
+
+
+# Per-skill request timeouts: point lookups fail fast, while list endpoints with
+# large payloads get more time. Tune without code changes through environment
+# variables, e.g. OPERATORS_TIMEOUT_GET_OPERATOR_LOTS=60
+HTTP_TIMEOUTS: Dict[str, httpx.Timeout] = {
+    "get_operator_by_id": _skill_timeout("get_operator_by_id", 5.0),
+    "get_all_operators": _skill_timeout("get_all_operators", 30.0),
+    "get_operator_lots": _skill_timeout("get_operator_lots", 20.0),
+    "get_operators_by_department": _skill_timeout("get_operators_by_department", 10.0),
+    "get_operator_by_code": _skill_timeout("get_operator_by_code", 5.0),
+    "get_operators_by_ids": _skill_timeout("get_operators_by_ids", 10.0),
+}
+
+# Endpoint path templates, relative to the client's base URL
+_OPERATORS_PATH = "/operators"
+_OPERATOR_PATH = "/operators/%s"
+_OPERATOR_LOTS_PATH = "/operators/%s/lots"
+_OPERATORS_BY_DEPARTMENT_PATH = "/operators/department/%s"
+_OPERATOR_BY_CODE_PATH = "/operators/code/%s"
+_OPERATORS_BATCH_PATH = "/operators/batch"
+
+# Base URLs whose server does not expose the batch endpoint, and the statuses
+# that identify such a server; lookups for these fall back to concurrent GETs
+_BATCH_UNSUPPORTED: set = set()
+_BATCH_UNSUPPORTED_STATUSES = (400, 404, 405)
+# Upper bound on concurrent GETs issued by one fallback batch, so a large batch
+# does not take every slot of the module-wide concurrency limit
+_BATCH_FALLBACK_CONCURRENCY = 20
+
+# Connect budget applied when a client is given its timeout in seconds, so a
+# dead host fails at connect time rather than after the full read budget. The
+# per-skill timeouts in HTTP_TIMEOUTS carry their own (2 s) connect budget
+_CONNECT_TIMEOUT = 5.0
+
+# Headers sent with every request, built once and attached to each owned client.
+# Accept-Encoding is left to httpx, which advertises every content decoder that
+# is installed (gzip and deflate always; br and zstd when available)
+_DEFAULT_HEADERS = httpx.Headers({
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+    "User-Agent": f"sam-operators/{__version__}",
+})
+
+# Shared clients, one per event loop and base URL, reused by the module-level
+# functions so that connections (TCP + TLS handshakes, DNS lookups) are kept
+# alive between calls. Connections cannot outlive the loop that opened them, so
+# each loop (e.g. each asyncio.run) gets its own clients
+_CLIENTS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Caller-supplied HTTP client (see use_client) that takes precedence over the
+# shared clients, so an application can route all calls through its own pool
+_CURRENT_CLIENT: contextvars.ContextVar[httpx.AsyncClient | None] = contextvars.ContextVar(
+    "operators_http_client", default=None
+)
+
+# Time-to-live (seconds) of cached operator lookups; operators are read-mostly
+# reference data, so a minute of staleness is acceptable
+_CACHE_TTL = 60.0
+
+# Response cache: key -> (monotonic timestamp, parsed response)
+_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+
+# Requests currently in flight: key -> future shared by all concurrent callers
+_inflight: Dict[Tuple[Any, ...], asyncio.Future] = {}
+
+# Validators for conditional GETs: (base URL, endpoint) -> (ETag, parsed response)
+_etag_by_endpoint: Dict[Tuple[str, str], Tuple[str, Any]] = {}
+
+# Trigram indexes over operator names and codes, built once a roster is searched
+# a second time: base URL -> (last roster searched, None or (snapshot of its
+# operators, lowercased texts, trigram -> snapshot positions))
+_search_index: Dict[
+    str,
+    Tuple[List[Operator], Tuple[Tuple[Operator, ...], List[str], Dict[str, set]] | None]
+] = {}
+
+# Directory of the persistent roster cache, which lets a freshly started process
+# revalidate the roster with a 304 instead of downloading it again; relocate it
+# with the OPERATORS_CACHE_DIR env var
+_DISK_CACHE_DIR = os.path.expanduser(os.environ.get("OPERATORS_CACHE_DIR", "~/.cache/sam-operators"))
+
+# Retry policy for transient failures (429/5xx responses and connection errors)
+_MAX_ATTEMPTS = 4
+_RETRY_BACKOFF = 0.05  # seconds, doubled after every attempt
+_RETRY_MAX_BACKOFF = 2.0
+_RETRY_AFTER_MAX = 10.0  # upper bound on server-requested Retry-After delays
+
+# Upper bound on concurrent in-flight requests per event loop, so large fan-outs
+# cannot exhaust sockets or file descriptors; tunable via the
+# OPERATORS_MAX_CONCURRENCY env var
+_MAX_CONCURRENCY = int(os.environ.get("OPERATORS_MAX_CONCURRENCY", "64"))
+_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
 
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
+# Last formatted timestamp: (epoch second, ISO 8601 string)
+_last_iso_ts: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string.
+
+    The formatted value is reused for all calls within the same second, which
+    keeps bulk summary generation from formatting a timestamp per record.
+    """
+    global _last_iso_ts
+    sec = int(time.time())
+    if sec != _last_iso_ts[0]:
+        _last_iso_ts = (sec, datetime.now(timezone.utc).isoformat())
+    return _last_iso_ts[1]
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Return the request semaphore of the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(_MAX_CONCURRENCY)
+    return semaphore
+
+
 async def _make_request(
+    client: httpx.AsyncClient,
     method: str,
     endpoint: str,
-    base_url: str = DEFAULT_BASE_URL,
-    json_data: Optional[Dict[str, Any]] = None,
-    params: Optional[Dict[str, Any]] = None,
-    timeout: int = 30
+    json_data: Dict[str, Any] | None = None,
+    params: Dict[str, Any] | None = None,
+    timeout: Any = httpx.USE_CLIENT_DEFAULT,
+    headers: Dict[str, str] | httpx.Headers | None = None,
+    accept: Tuple[int, ...] = (httpx.codes.NOT_MODIFIED,)
 ) -> httpx.Response:
     """
     Internal async helper function to make HTTP requests.
 
+    Transient failures (429 and 5xx responses, connection errors) are retried
+    with exponential backoff, honouring the Retry-After header when present.
+    All requests issued by this module are reads, so retrying them is safe.
+    At most OPERATORS_MAX_CONCURRENCY requests are in flight at any time.
+
     Args:
+        client: Pooled HTTP client the request is sent through
         method: HTTP method (GET, POST, PUT, DELETE)
-        endpoint: API endpoint path
-        base_url: Base URL of the API
+        endpoint: API endpoint path, relative to the client's base URL
         json_data: JSON payload for POST/PUT requests
         params: Query parameters
-        timeout: Request timeout in seconds
+        timeout: Request timeout override (defaults to the client's timeout)
+        headers: Extra request headers, e.g. If-None-Match for conditional GETs
+        accept: Non-2xx statuses returned to the caller instead of raised
 
     Returns:
-        Response object
+        Response object (statuses listed in accept are returned, not raised)
 
     Raises:
         httpx.HTTPStatusError: On request failure
     """
-    url = f"{base_url}{endpoint}"
+    # Encode straight to bytes, skipping the intermediate str copy that
+    # httpx's json= path makes. The Content-Type header is set per request, as a
+    # borrowed client (see use_client) does not carry the module's default headers
+    content = None
+    if json_data is not None:
+        content = _dumps(json_data)
+        headers = httpx.Headers(headers)
+        headers.setdefault("Content-Type", "application/json")
+    # URL merging, query encoding and header merging happen once, not per retry
+    request = client.build_request(
+        method=method,
+        url=endpoint,
+        content=content,
+        params=params,
+        headers=headers,
+        timeout=timeout
+    )
+
+    for attempt in range(_MAX_ATTEMPTS):
+        last_attempt = attempt == _MAX_ATTEMPTS - 1
+        try:
+            async with _get_semaphore():
+                response = await client.send(request)
+        except httpx.TimeoutException:
+            # A timed out request already spent its full budget; don't multiply it
+            raise
+        except httpx.TransportError:
+            if last_attempt:
+                raise
+            delay = _retry_delay(attempt)
+        else:
+            if last_attempt or not _is_retryable(response.status_code):
+                break
+            delay = _retry_delay(attempt, response.headers.get("Retry-After"))
+        await asyncio.sleep(delay)
+
+    _logger.debug(
+        "%s %s -> %s (content-encoding: %s)",
+        method, request.url, response.status_code,
+        response.headers.get("Content-Encoding", "identity")
+    )
+    if response.status_code not in accept:
+        response.raise_for_status()
+    return response
+
+
+def _parse(response: httpx.Response) -> Any:
+    """Decode a JSON response body straight from its raw bytes."""
+    return _loads(response.content)
+
+
+def _is_retryable(status_code: int) -> bool:
+    """Whether a response status indicates a transient server-side failure."""
+    return status_code == 429 or status_code >= 500
+
+
+def _retry_delay(attempt: int, retry_after: str | None = None) -> float:
+    """
+    Compute how long to wait before the next attempt.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        retry_after: Value of the Retry-After response header, if any
+
+    Returns:
+        Delay in seconds
+    """
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), _RETRY_AFTER_MAX)
+        except ValueError:
+            pass  # HTTP-date form; fall back to exponential backoff
+    return min(_RETRY_BACKOFF * 2 ** attempt, _RETRY_MAX_BACKOFF)
+
+
+class _AsyncBytesReader:
+    """Adapt an async iterator of byte chunks to the async read() interface ijson expects."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+        self._buffer = b""
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) and treats any other empty read as end of input
+        if size == 0:
+            return b""
+        while not self._buffer:
+            chunk = await anext(self._chunks, None)
+            if chunk is None:
+                return b""
+            self._buffer = chunk
+        if size < 0 or size >= len(self._buffer):
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+# ============================================================================
+# Cache
+# ============================================================================
+
+async def _coalesce(key: Tuple[Any, ...], coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run coro_factory() once for all concurrent callers using the same key.
+
+    The first caller starts the request; callers arriving while it is in flight
+    await the same future instead of issuing a duplicate request.
+
+    Args:
+        key: Request key, e.g. ("id", operator_id, base_url)
+        coro_factory: Zero-argument callable returning the coroutine to run
+
+    Returns:
+        Result of the shared request
+    """
+    future = _inflight.get(key)
+    # A future belongs to one event loop; callers on another loop (e.g. a
+    # SyncOperatorsClient's background loop) start their own request
+    if future is None or future.get_loop() is not asyncio.get_running_loop():
+        future = asyncio.ensure_future(coro_factory())
+        _inflight[key] = future
+
+        def done(finished: asyncio.Future) -> None:
+            if _inflight.get(key) is finished:
+                del _inflight[key]
+            # Mark a failure as retrieved even if every waiter was cancelled,
+            # otherwise asyncio logs "Task exception was never retrieved"
+            if not finished.cancelled():
+                finished.exception()
+        future.add_done_callback(done)
+    # Shield the shared request so one cancelled caller does not cancel it for the rest
+    return await asyncio.shield(future)
+
+
+def _cache_get(key: Tuple[Any, ...]) -> Any:
+    """Return the cached response for key, or None if missing or expired."""
+    entry = _cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < _CACHE_TTL:
+        return entry[1]
+    return None
+
+
+async def _cached(key: Tuple[Any, ...], coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Return a cached response for key, or await coro_factory() and cache it.
+
+    Concurrent misses for the same key are coalesced into a single request.
+
+    Args:
+        key: Cache key, e.g. ("id", operator_id, base_url)
+        coro_factory: Zero-argument callable returning the coroutine to await on a miss
+
+    Returns:
+        Cached or freshly fetched parsed response
+    """
+    value = _cache_get(key)
+    if value is not None:
+        return value
+
+    async def fetch_and_store() -> Any:
+        value = await coro_factory()
+        _cache[key] = (time.monotonic(), value)
+        return value
+
+    return await _coalesce(key, fetch_and_store)
+
+
+def _copy_records(value: Any) -> Any:
+    """
+    Copy cached operator data on its way out to a caller.
+
+    Cached dicts are shared by every lookup (and by the search index), so a
+    caller editing its result must not change what later callers receive.
+    Operator records are flat, so copying each dict is enough.
+    """
+    if isinstance(value, list):
+        return [dict(item) for item in value]
+    return dict(value) if value is not None else None
+
+
+def _cache_operator(operator: Operator, base_url: str) -> Operator:
+    """Cache an operator under both its ID and its code, so either lookup hits."""
+    entry = (time.monotonic(), operator)
+    _cache[("id", operator.get("operatorId"), base_url)] = entry
+    _cache[("code", operator.get("operatorCode"), base_url)] = entry
+    return operator
+
+
+# Names of the files written by _write_disk_entry (including interrupted temp
+# files), so invalidation never touches other files in a shared directory
+_DISK_CACHE_FILE = re.compile(r"[0-9a-f]{32}\.json(\.\d+\.tmp)?")
+
+
+def _disk_cache_path(base_url: str, endpoint: str) -> str:
+    """Return the file storing the persisted response of an endpoint."""
+    digest = hashlib.sha256(f"{base_url}{endpoint}".encode()).hexdigest()[:32]
+    return os.path.join(_DISK_CACHE_DIR, f"{digest}.json")
+
+
+def _read_disk_entry(base_url: str, endpoint: str) -> Tuple[str, Any] | None:
+    """Load a persisted (ETag, parsed response) pair, or None if absent or unreadable."""
+    try:
+        with open(_disk_cache_path(base_url, endpoint), "rb") as f:
+            entry = _loads(f.read())
+        return entry["etag"], entry["body"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_disk_entry(base_url: str, endpoint: str, etag: str, body: Any) -> None:
+    """Persist an (ETag, parsed response) pair; failures only cost a future download."""
+    path = _disk_cache_path(base_url, endpoint)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        # The roster holds employee details, so keep it private to the user
+        os.makedirs(_DISK_CACHE_DIR, mode=0o700, exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "wb") as f:
+            f.write(_dumps({"etag": etag, "body": body}))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.request(
-            method=method,
-            url=url,
-            json=json_data,
-            params=params,
-            headers={"Content-Type": "application/json", "Accept": "application/json"}
+
+def clear_cache() -> None:
+    """
+    Drop all cached responses and conditional-GET validators.
+
+    Example:
+        >>> clear_cache()
+    """
+    _cache.clear()
+    _etag_by_endpoint.clear()
+
+
+def invalidate_cache() -> None:
+    """
+    Drop all cached responses, including the persistent on-disk roster cache.
+
+    Example:
+        >>> invalidate_cache()
+    """
+    clear_cache()
+    try:
+        names = os.listdir(_DISK_CACHE_DIR)
+    except OSError:
+        return
+    for name in names:
+        if _DISK_CACHE_FILE.fullmatch(name):
+            try:
+                os.remove(os.path.join(_DISK_CACHE_DIR, name))
+            except OSError:
+                pass
+
+
+def invalidate_operator(operator_id: int) -> None:
+    """
+    Drop every cached response that refers to an operator.
+
+    Removes the cached ID lookup as well as code lookups and department
+    listings containing the operator, so the next call goes to the API.
+
+    Args:
+        operator_id: The unique identifier of the operator
+
+    Example:
+        >>> invalidate_operator(1)
+    """
+    for key, (_, value) in list(_cache.items()):
+        records = value if isinstance(value, list) else [value]
+        if key[:2] == ("id", operator_id) or any(r.get("operatorId") == operator_id for r in records):
+            del _cache[key]
+
+
+# ============================================================================
+# Client
+# ============================================================================
+
+class AsyncOperatorsClient:
+    """
+    Async client for the Operators API holding one pooled HTTP connection pool.
+
+    Use it as an async context manager to scope connections to a task, pipeline
+    or application lifespan; connections are released deterministically on exit.
+    The module-level functions use a lazily-created shared instance per event
+    loop and base URL.
+
+    An existing httpx.AsyncClient can be passed in to reuse an application-wide
+    pool; such a client is borrowed and never closed by this class.
+
+    Example:
+        >>> async with AsyncOperatorsClient() as client:
+        ...     operator = await client.get_operator_by_id(1)
+        ...     lots = await client.get_operator_lots(1)
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float | httpx.Timeout | None = None,
+        client: httpx.AsyncClient | None = None
+    ):
+        """
+        Args:
+            base_url: Base URL for the API (default: http://localhost:8080/api/v1)
+            timeout: Request timeout, in seconds or as an httpx.Timeout, applied to
+                     every request of this client (also through a borrowed client).
+                     A value in seconds connects within at most 5 s. Defaults to the
+                     per-skill timeouts in HTTP_TIMEOUTS
+            client: Optional caller-owned HTTP client to send requests through
+        """
+        self.base_url = base_url
+        if isinstance(timeout, (int, float)):
+            timeout = httpx.Timeout(timeout, connect=min(timeout, _CONNECT_TIMEOUT))
+        self._timeout = timeout
+        self._owns_client = client is None
+        # Paths are relative to the owned client's base URL. A borrowed client
+        # may belong to another service, so its requests always use absolute
+        # URLs (httpx ignores the client's base_url for those)
+        self._prefix = ""
+        if client is not None:
+            self._client = client
+            self._prefix = base_url.rstrip("/")
+            return
+        # No client-wide timeout: every request carries its own (_request_timeout)
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=_DEFAULT_HEADERS,
+            # Limits and HTTP/2 have to be configured on the transport when
+            # passing one; connection errors are retried by _make_request alone
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            ),
+        )
+
+    async def __aenter__(self) -> "AsyncOperatorsClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the underlying connection pool has been closed."""
+        return self._client.is_closed
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool, unless it is borrowed."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    def _request_headers(self, extra: Dict[str, str] | None = None) -> httpx.Headers | Dict[str, str] | None:
+        """Return per-request headers; a borrowed client lacks the module's default headers."""
+        if self._owns_client:
+            return extra
+        headers = httpx.Headers(_DEFAULT_HEADERS)
+        if extra:
+            headers.update(extra)
+        return headers
+
+    def _request_timeout(self, skill: str) -> httpx.Timeout:
+        """Return the timeout of a skill's requests: the client's own, else the skill default."""
+        return self._timeout or HTTP_TIMEOUTS[skill]
+
+    async def _get_json(self, endpoint: str, skill: str) -> Any:
+        """GET an endpoint with the timeout of the given skill and decode its body."""
+        response = await _make_request(
+            self._client,
+            "GET",
+            self._prefix + endpoint,
+            headers=self._request_headers(),
+            timeout=self._request_timeout(skill)
+        )
+        return _parse(response)
+
+    async def _get_conditional(self, endpoint: str, skill: str, persist: bool = False) -> Any:
+        """
+        GET a rarely-changing endpoint, revalidating the last response by ETag.
+
+        When the server answers 304 Not Modified the previously parsed body is
+        returned, so neither the payload nor its parsing cost is paid again.
+        With persist=True the validated response is also kept on disk, so it
+        survives process restarts.
+        """
+        key = (self.base_url, endpoint)
+        cached = _etag_by_endpoint.get(key)
+        if cached is None and persist:
+            cached = await asyncio.to_thread(_read_disk_entry, self.base_url, endpoint)
+        response = await _make_request(
+            self._client,
+            "GET",
+            self._prefix + endpoint,
+            headers=self._request_headers({"If-None-Match": cached[0]} if cached else None),
+            timeout=self._request_timeout(skill)
+        )
+        if cached and response.status_code == httpx.codes.NOT_MODIFIED:
+            # Keep a validator loaded from disk in memory, so later calls skip the file
+            _etag_by_endpoint[key] = cached
+            return cached[1]
+        body = _parse(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            _etag_by_endpoint[key] = (etag, body)
+            if persist:
+                await asyncio.to_thread(_write_disk_entry, self.base_url, endpoint, etag, body)
+        return body
+
+    async def get_operator_by_id(self, operator_id: int) -> Operator:
+        """Get operator by ID (see module-level get_operator_by_id)."""
+        async def fetch() -> Operator:
+            operator = await self._get_json(_OPERATOR_PATH % operator_id, "get_operator_by_id")
+            return _cache_operator(operator, self.base_url)
+        return _copy_records(await _cached(("id", operator_id, self.base_url), fetch))
+
+    async def _find_operator_by_id(self, operator_id: int) -> Operator | None:
+        """Like get_operator_by_id, but a 404 yields None instead of an exception."""
+        operator = _cache_get(("id", operator_id, self.base_url))
+        if operator is not None:
+            return _copy_records(operator)
+
+        async def fetch() -> Operator | None:
+            response = await _make_request(
+                self._client,
+                "GET",
+                self._prefix + _OPERATOR_PATH % operator_id,
+                headers=self._request_headers(),
+                timeout=self._request_timeout("get_operator_by_id"),
+                accept=(httpx.codes.NOT_FOUND,)
+            )
+            if response.status_code == httpx.codes.NOT_FOUND:
+                return None
+            return _cache_operator(_parse(response), self.base_url)
+        return _copy_records(await _coalesce(("find", operator_id, self.base_url), fetch))
+
+    async def get_all_operators(
+        self,
+        status: str | None = None,
+        as_objects: bool = False
+    ) -> List[Operator] | List[OperatorRecord]:
+        """
+        Get all operators (see module-level get_all_operators).
+
+        Args:
+            status: Optional status to filter by. The API has no status
+                    filter, so the cached roster is filtered client-side.
+            as_objects: Return OperatorRecord instances instead of dictionaries
+        """
+        operators = await self._get_roster()
+        if status:
+            operators = [op for op in operators if op.get("status") == status]
+        if as_objects:
+            return _to_records(operators, OperatorRecord)
+        # Copy the shared cached records so callers may sort or edit them
+        return _copy_records(operators)
+
+    async def _get_roster(self) -> List[Operator]:
+        """Return the full roster as cached by ETag revalidation; callers must not mutate it."""
+        return await _coalesce(
+            ("all", self.base_url),
+            lambda: self._get_conditional(
+                _OPERATORS_PATH, "get_all_operators", persist=True
+            )
         )
-        response.raise_for_status()
-        return response
+
+    async def get_operator_lots(
+        self,
+        operator_id: int,
+        as_objects: bool = False
+    ) -> List[Lot] | List[LotRecord]:
+        """
+        Get operator's lots (see module-level get_operator_lots).
+
+        Args:
+            operator_id: The unique identifier of the operator
+            as_objects: Return LotRecord instances instead of dictionaries
+        """
+        lots = await _coalesce(
+            ("lots", operator_id, self.base_url),
+            lambda: self._get_json(_OPERATOR_LOTS_PATH % operator_id, "get_operator_lots")
+        )
+        if as_objects:
+            return _to_records(lots, LotRecord)
+        return lots
+
+    async def _iter_items(self, endpoint: str, skill: str) -> AsyncIterator[Any]:
+        """
+        Stream the elements of a JSON array response as they are received.
+
+        Follows the same policy as _make_request: opening the stream takes a slot
+        of the concurrency limit, and transient failures are retried with
+        backoff. The slot is released once the response headers have arrived,
+        so API calls made while consuming the items cannot wait on a slot held
+        by their own stream. Retries happen before the first element is
+        yielded, so a stream that fails midway is never replayed.
+        """
+        request = self._client.build_request(
+            "GET",
+            self._prefix + endpoint,
+            headers=self._request_headers(),
+            timeout=self._request_timeout(skill)
+        )
+        for attempt in range(_MAX_ATTEMPTS):
+            last_attempt = attempt == _MAX_ATTEMPTS - 1
+            try:
+                async with _get_semaphore():
+                    response = await self._client.send(request, stream=True)
+            except httpx.TimeoutException:
+                raise
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+                delay = _retry_delay(attempt)
+            else:
+                try:
+                    if last_attempt or not _is_retryable(response.status_code):
+                        response.raise_for_status()
+                        reader = _AsyncBytesReader(response.aiter_bytes())
+                        async for item in ijson.items_async(reader, "item", use_float=True):
+                            yield item
+                        return
+                    delay = _retry_delay(attempt, response.headers.get("Retry-After"))
+                finally:
+                    await response.aclose()
+            await asyncio.sleep(delay)
+
+    async def iter_all_operators(self) -> AsyncIterator[Operator]:
+        """Stream all operators one by one (see module-level iter_all_operators)."""
+        # aclosing() releases the stream as soon as the caller stops iterating,
+        # instead of when the inner generator is garbage-collected
+        async with aclosing(self._iter_items(_OPERATORS_PATH, "get_all_operators")) as operators:
+            async for operator in operators:
+                yield operator
+
+    async def iter_operator_lots(self, operator_id: int) -> AsyncIterator[Lot]:
+        """Stream operator's lots one by one (see module-level iter_operator_lots)."""
+        async with aclosing(
+            self._iter_items(_OPERATOR_LOTS_PATH % operator_id, "get_operator_lots")
+        ) as lots:
+            async for lot in lots:
+                yield lot
+
+    async def get_operators_by_ids(self, ids: Iterable[int]) -> List[Operator | None]:
+        """Get multiple operators by ID (see module-level get_operators_by_ids)."""
+        ids = list(ids)
+        if not ids:
+            return []
+        if self.base_url not in _BATCH_UNSUPPORTED:
+            try:
+                response = await _make_request(
+                    self._client,
+                    "POST",
+                    self._prefix + _OPERATORS_BATCH_PATH,
+                    json_data={"ids": ids},
+                    headers=self._request_headers(),
+                    timeout=self._request_timeout("get_operators_by_ids")
+                )
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in _BATCH_UNSUPPORTED_STATUSES:
+                    raise
+                _BATCH_UNSUPPORTED.add(self.base_url)
+            else:
+                by_id = {op.get("operatorId"): op for op in _parse(response)}
+                return [by_id.get(i) for i in ids]
+
+        semaphore = asyncio.Semaphore(_BATCH_FALLBACK_CONCURRENCY)
+
+        async def fetch(operator_id: int) -> Operator | None:
+            async with semaphore:
+                return await self._find_operator_by_id(operator_id)
+        return list(await asyncio.gather(*map(fetch, ids)))
+
+    async def get_operators_by_department(self, department: str) -> List[Operator]:
+        """Get operators by department (see module-level get_operators_by_department)."""
+        async def fetch() -> List[Operator]:
+            return await self._get_conditional(
+                _OPERATORS_BY_DEPARTMENT_PATH % department,
+                "get_operators_by_department"
+            )
+        return _copy_records(await _cached(("department", department, self.base_url), fetch))
+
+    async def get_operator_by_code(self, code: str) -> Operator:
+        """Get operator by code (see module-level get_operator_by_code)."""
+        async def fetch() -> Operator:
+            operator = await self._get_json(_OPERATOR_BY_CODE_PATH % code, "get_operator_by_code")
+            return _cache_operator(operator, self.base_url)
+        return _copy_records(await _cached(("code", code, self.base_url), fetch))
+
+
+class SyncOperatorsClient:
+    """
+    Blocking client for the Operators API, for scripts and notebooks.
+
+    Wrapping each async call in asyncio.run creates and tears down an event loop
+    and its connections on every call. This client instead runs one event loop
+    in a background thread for its whole lifetime and submits every call to it,
+    so its pooled HTTP/2 connections stay open between calls. Close it (or use
+    it as a context manager) to release the connections and stop the thread.
+
+    Example:
+        >>> with SyncOperatorsClient() as client:
+        ...     operator = client.get_operator_by_id(1)
+        ...     lots = client.get_operator_lots(1)
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float | httpx.Timeout | None = None
+    ):
+        """
+        Args:
+            base_url: Base URL for the API (default: http://localhost:8080/api/v1)
+            timeout: Request timeout, in seconds or as an httpx.Timeout, applied to
+                     every request. Defaults to the per-skill timeouts in HTTP_TIMEOUTS
+        """
+        self.base_url = base_url
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="sam-operators-loop", daemon=True
+        )
+        self._thread.start()
+        self._client = AsyncOperatorsClient(base_url, timeout=timeout)
+
+    def __enter__(self) -> "SyncOperatorsClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _run(self, coro: Awaitable[Any]) -> Any:
+        """Run a coroutine on the background loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def close(self) -> None:
+        """Close the connection pool and stop the background event loop."""
+        if self._loop.is_closed():
+            return
+        try:
+            self._run(self._client.aclose())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    def get_operator_by_id(self, operator_id: int) -> Operator:
+        """Get operator by ID (see module-level get_operator_by_id)."""
+        return self._run(self._client.get_operator_by_id(operator_id))
+
+    def get_all_operators(
+        self,
+        status: str | None = None,
+        as_objects: bool = False
+    ) -> List[Operator] | List[OperatorRecord]:
+        """Get all operators (see module-level get_all_operators)."""
+        return self._run(self._client.get_all_operators(status=status, as_objects=as_objects))
+
+    def get_operator_lots(
+        self,
+        operator_id: int,
+        as_objects: bool = False
+    ) -> List[Lot] | List[LotRecord]:
+        """Get operator's lots (see module-level get_operator_lots)."""
+        return self._run(self._client.get_operator_lots(operator_id, as_objects=as_objects))
+
+    def get_operators_by_ids(self, ids: Iterable[int]) -> List[Operator | None]:
+        """Get multiple operators by ID (see module-level get_operators_by_ids)."""
+        return self._run(self._client.get_operators_by_ids(ids))
+
+    def get_operators_by_department(self, department: str) -> List[Operator]:
+        """Get operators by department (see module-level get_operators_by_department)."""
+        return self._run(self._client.get_operators_by_department(department))
+
+    def get_operator_by_code(self, code: str) -> Operator:
+        """Get operator by code (see module-level get_operator_by_code)."""
+        return self._run(self._client.get_operator_by_code(code))
+
+
+def _get_client(base_url: str = DEFAULT_BASE_URL) -> AsyncOperatorsClient:
+    """
+    Return the shared client for a base URL on the running event loop,
+    creating it on first use.
+
+    Inside a use_client() block the caller-supplied HTTP client is used instead.
+
+    Args:
+        base_url: Base URL of the API
+
+    Returns:
+        Shared AsyncOperatorsClient bound to the base URL
+    """
+    injected = _CURRENT_CLIENT.get()
+    if injected is not None:
+        return AsyncOperatorsClient(base_url, client=injected)
+    clients = _CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(base_url)
+    if client is None or client.is_closed:
+        client = AsyncOperatorsClient(base_url)
+        clients[base_url] = client
+    return client
+
+
+@contextmanager
+def use_client(client: httpx.AsyncClient) -> Iterator[httpx.AsyncClient]:
+    """
+    Route module-level API calls through a caller-supplied HTTP client.
+
+    Applies to the current context (task) only, so concurrent tasks may use
+    different clients. The client is not closed when the block exits. Requests
+    still go to the base_url passed to each API function, whatever base URL the
+    client itself was created with.
+
+    Args:
+        client: Application-owned httpx.AsyncClient
+
+    Example:
+        >>> async with httpx.AsyncClient() as http:
+        ...     with use_client(http):
+        ...         operator = await get_operator_by_id(1)
+    """
+    token = _CURRENT_CLIENT.set(client)
+    try:
+        yield client
+    finally:
+        _CURRENT_CLIENT.reset(token)
+
+
+async def aclose_all() -> None:
+    """
+    Close the shared clients used by the module-level functions on this event loop.
+
+    Call this on application shutdown to release open connections. Clients are
+    recreated transparently if the API functions are used again afterwards.
+    """
+    clients = list(_CLIENTS.pop(asyncio.get_running_loop(), {}).values())
+    for client in clients:
+        await client.aclose()
+
+
+def install_uvloop() -> bool:
+    """
+    Make uvloop the event loop policy for loops created from now on.
+
+    uvloop (libuv-based) cuts per-callback and per-socket overhead of the
+    default asyncio loop, which pays off on large asyncio.gather fan-outs over
+    the shared clients. Call it before the application creates its event loop
+    (e.g. before asyncio.run), or set OPERATORS_USE_UVLOOP=1 to install it when
+    this module is imported. Loops that are already running are unaffected.
+
+    Returns:
+        True if uvloop was installed, False if it is not available (not
+        installed, or running on Windows)
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+if os.environ.get("OPERATORS_USE_UVLOOP", "").lower() in ("1", "true", "yes"):
+    install_uvloop()
 
 
 # ============================================================================
@@ -235,11 +1329,14 @@ async def get_operator_by_id(operator_id: int, base_url: str = DEFAULT_BASE_URL)
         >>> print(operator['operatorName'])
         'John Smith'
     """
-    response = await _make_request("GET", f"/operators/{operator_id}", base_url=base_url)
-    return response.json()
+    client = _get_client(base_url)
+    return await client.get_operator_by_id(operator_id)
 
 
-async def get_all_operators(base_url: str = DEFAULT_BASE_URL) -> List[Operator]:
+async def get_all_operators(
+    base_url: str = DEFAULT_BASE_URL,
+    as_objects: bool = False
+) -> List[Operator] | List[OperatorRecord]:
     """
     Get all operators.
 
@@ -314,9 +1411,10 @@ async def get_all_operators(base_url: str = DEFAULT_BASE_URL) -> List[Operator]:
 
     Args:
         base_url: Base URL for the API (default: http://localhost:8080/api/v1)
+        as_objects: Return OperatorRecord instances instead of dictionaries
 
     Returns:
-        List of Operator dictionaries
+        List of Operator dictionaries (or OperatorRecord instances)
 
     Raises:
         httpx.HTTPStatusError: If the API request fails
@@ -326,11 +1424,15 @@ async def get_all_operators(base_url: str = DEFAULT_BASE_URL) -> List[Operator]:
         >>> print(f"Total operators: {len(operators)}")
         Total operators: 25
     """
-    response = await _make_request("GET", "/operators", base_url=base_url)
-    return response.json()
+    client = _get_client(base_url)
+    return await client.get_all_operators(as_objects=as_objects)
 
 
-async def get_operator_lots(operator_id: int, base_url: str = DEFAULT_BASE_URL) -> List[Lot]:
+async def get_operator_lots(
+    operator_id: int,
+    base_url: str = DEFAULT_BASE_URL,
+    as_objects: bool = False
+) -> List[Lot] | List[LotRecord]:
     """
     Get operator's lots.
 
@@ -456,9 +1558,10 @@ async def get_operator_lots(operator_id: int, base_url: str = DEFAULT_BASE_URL)
     Args:
         operator_id: The unique identifier of the operator
         base_url: Base URL for the API (default: http://localhost:8080/api/v1)
+        as_objects: Return LotRecord instances instead of dictionaries
 
     Returns:
-        List of Lot dictionaries processed by the operator
+        List of Lot dictionaries (or LotRecord instances) processed by the operator
 
     Raises:
         httpx.HTTPStatusError: If the API request fails
@@ -470,8 +1573,8 @@ async def get_operator_lots(operator_id: int, base_url: str = DEFAULT_BASE_URL)
         >>> print(f"First lot: {lots[0]['lotNumber']}")
         First lot: LOT001
     """
-    response = await _make_request("GET", f"/operators/{operator_id}/lots", base_url=base_url)
-    return response.json()
+    client = _get_client(base_url)
+    return await client.get_operator_lots(operator_id, as_objects=as_objects)
 
 
 async def get_operators_by_department(department: str, base_url: str = DEFAULT_BASE_URL) -> List[Operator]:
@@ -572,8 +1675,8 @@ async def get_operators_by_department(department: str, base_url: str = DEFAULT_B
         >>> print(f"Production department has {len(prod_operators)} operators")
         Production department has 12 operators
     """
-    response = await _make_request("GET", f"/operators/department/{department}", base_url=base_url)
-    return response.json()
+    client = _get_client(base_url)
+    return await client.get_operators_by_department(department)
 
 
 async def get_operator_by_code(code: str, base_url: str = DEFAULT_BASE_URL) -> Operator:
@@ -672,8 +1775,71 @@ async def get_operator_by_code(code: str, base_url: str = DEFAULT_BASE_URL) -> O
         >>> print(f"{operator['operatorName']} - {operator['department']}")
         John Smith - Production
     """
-    response = await _make_request("GET", f"/operators/code/{code}", base_url=base_url)
-    return response.json()
+    client = _get_client(base_url)
+    return await client.get_operator_by_code(code)
+
+
+# ============================================================================
+# Streaming Functions
+# ============================================================================
+
+async def iter_all_operators(base_url: str = DEFAULT_BASE_URL) -> AsyncIterator[Operator]:
+    """
+    Stream all operators as they arrive.
+
+    Incrementally parses the response of GET /operators and yields each
+    operator as soon as it has been received. Breaking out of the loop closes
+    the response, so a scan that stops at the first match does not download the
+    rest of the roster. Results bypass the roster cache.
+
+    Args:
+        base_url: Base URL for the API (default: http://localhost:8080/api/v1)
+
+    Yields:
+        Operator dictionaries
+
+    Raises:
+        httpx.HTTPStatusError: If the API request fails
+
+    Example:
+        >>> async for op in iter_all_operators():
+        ...     if op['operatorName'].startswith('Kim'):
+        ...         break
+    """
+    client = _get_client(base_url)
+    async with aclosing(client.iter_all_operators()) as operators:
+        async for operator in operators:
+            yield operator
+
+
+async def iter_operator_lots(operator_id: int, base_url: str = DEFAULT_BASE_URL) -> AsyncIterator[Lot]:
+    """
+    Stream operator's lots as they arrive.
+
+    Incrementally parses the response of GET /operators/{operator_id}/lots and
+    yields each lot as soon as it has been received, so memory stays bounded by
+    a single record and parsing overlaps with the network transfer. Prefer this
+    over get_operator_lots for operators with a very large production history.
+
+    Args:
+        operator_id: The unique identifier of the operator
+        base_url: Base URL for the API (default: http://localhost:8080/api/v1)
+
+    Yields:
+        Lot dictionaries processed by the operator
+
+    Raises:
+        httpx.HTTPStatusError: If the API request fails
+
+    Example:
+        >>> wafers = 0
+        >>> async for lot in iter_operator_lots(1):
+        ...     wafers += lot['waferCount']
+    """
+    client = _get_client(base_url)
+    async with aclosing(client.iter_operator_lots(operator_id)) as lots:
+        async for lot in lots:
+            yield lot
 
 
 # ============================================================================
@@ -817,7 +1983,7 @@ async def get_operator_summary(operator_id: int, base_url: str = DEFAULT_BASE_UR
         summary_generated_at:
           type: string
           format: date-time
-          description: ISO 8601 timestamp when the summary was generated
+          description: ISO 8601 UTC timestamp when the summary was generated (second resolution)
 
     error_responses:
       - status: 404
@@ -839,27 +2005,252 @@ async def get_operator_summary(operator_id: int, base_url: str = DEFAULT_BASE_UR
         >>> summary = await get_operator_summary(1)
         >>> print(f"{summary['operator']['operatorName']} processed {summary['total_lots']} lots")
     """
-    operator = await get_operator_by_id(operator_id, base_url)
-    lots = await get_operator_lots(operator_id, base_url)
+    # Both lookups depend only on operator_id, so issue them concurrently
+    operator, lots = await asyncio.gather(
+        get_operator_by_id(operator_id, base_url),
+        get_operator_lots(operator_id, base_url),
+    )
 
     return {
         "operator": operator,
         "lots": lots,
         "total_lots": len(lots),
         "departments": [operator.get("department")],
-        "summary_generated_at": datetime.now().isoformat()
+        "summary_generated_at": _now_iso()
     }
 
 
-async def search_operators(
-    department: Optional[str] = None,
-    status: Optional[str] = None,
+async def get_operators_by_ids(
+    ids: Iterable[int],
     base_url: str = DEFAULT_BASE_URL
+) -> List[Operator | None]:
+    """
+    Get multiple operators by ID in one call.
+
+    Sends a single POST /operators/batch request so the server resolves all IDs
+    with one set-oriented query. This is the recommended path; until the backend
+    exposes the batch endpoint, the lookups are issued concurrently (at most 20 at
+    a time) over the shared HTTP/2 connection instead, completing in roughly one
+    round-trip; duplicate IDs share a single request. Support is probed once per
+    base URL.
+
+    Agent_card:
+    -----------
+    skill_id: get_operators_by_ids
+    skill_name: Get Operators by IDs
+    description: Retrieves detailed information for several production operators at once
+                 using their unique operator IDs. Returns the operator profiles in the
+                 same order as the requested IDs, with null for IDs that do not exist.
+    capabilities:
+      - Fetch multiple operator records in a single call
+      - Resolve operator ID ranges or lists
+      - Support bulk operator reporting
+
+    A2A Spec:
+    ---------
+    input_schema:
+      type: object
+      required:
+        - ids
+      properties:
+        ids:
+          type: array
+          items:
+            type: integer
+            format: int32
+          description: Unique identifiers of the operators
+          example: [1, 2, 3]
+        base_url:
+          type: string
+          description: Optional base URL for the API (default: http://localhost:8080/api/v1)
+          example: "http://localhost:8080/api/v1"
+
+    output_schema:
+      type: array
+      items:
+        type: object
+        nullable: true
+        description: Operator record (same schema as get_operator_by_id), or null if
+                     no operator has the requested ID
+
+    error_responses:
+      - status: 500
+        description: Internal server error
+
+    Args:
+        ids: Unique operator identifiers
+        base_url: Base URL for the API
+
+    Returns:
+        List with one entry per requested ID, in the order of ids: the Operator
+        dictionary, or None if the operator does not exist
+
+    Raises:
+        httpx.HTTPStatusError: If the API request fails
+
+    Example:
+        >>> operators = await get_operators_by_ids([1, 2, 3])
+        >>> print([op['operatorCode'] for op in operators])
+        ['OP001', 'OP002', 'OP003']
+    """
+    client = _get_client(base_url)
+    return await client.get_operators_by_ids(ids)
+
+
+async def get_department_lots(department: str, base_url: str = DEFAULT_BASE_URL) -> Dict[int, List[Lot]]:
+    """
+    Get production lots for every operator in a department.
+
+    Fetches the department roster, then requests every operator's lots concurrently;
+    over the shared HTTP/2 connection these requests are multiplexed as parallel
+    streams instead of being sent one after another.
+
+    Agent_card:
+    -----------
+    skill_id: get_department_lots
+    skill_name: Get Department Production Lots
+    description: Retrieves the production lots processed by each operator of a department
+                 in a single call. Useful for department-level productivity and quality
+                 reporting without looking up every operator individually.
+    capabilities:
+      - Aggregate production history per department
+      - Compare operator productivity within a department
+      - Generate department production reports
+
+    A2A Spec:
+    ---------
+    input_schema:
+      type: object
+      required:
+        - department
+      properties:
+        department:
+          type: string
+          description: Department name to filter by
+          example: "Production"
+          enum: ["Production", "Quality", "Maintenance", "Engineering"]
+        base_url:
+          type: string
+          description: Optional base URL for the API (default: http://localhost:8080/api/v1)
+          example: "http://localhost:8080/api/v1"
+
+    output_schema:
+      type: object
+      description: Mapping of operatorId to the list of lots processed by that operator
+      additionalProperties:
+        type: array
+        items:
+          type: object
+          description: Lot record (same schema as get_operator_lots)
+
+    error_responses:
+      - status: 404
+        description: Department not found or no operators in department
+      - status: 500
+        description: Internal server error
+
+    Args:
+        department: Name of the department
+        base_url: Base URL for the API
+
+    Returns:
+        Dictionary mapping operator ID to that operator's lots
+
+    Raises:
+        httpx.HTTPStatusError: If any of the API requests fails
+
+    Example:
+        >>> lots_by_operator = await get_department_lots("Production")
+        >>> print(sum(len(lots) for lots in lots_by_operator.values()))
+    """
+    operators = await get_operators_by_department(department, base_url)
+    ids = [op["operatorId"] for op in operators]
+    lots = await asyncio.gather(*[get_operator_lots(i, base_url) for i in ids])
+    return dict(zip(ids, lots))
+
+
+def _trigrams(text: str) -> set:
+    """Return the set of three-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _search_text(operator: Operator) -> str:
+    """Return the lowercased name and code of an operator, as matched by queries."""
+    return f"{operator.get('operatorName') or ''}\x00{operator.get('operatorCode') or ''}".lower()
+
+
+def _match_operators(roster: List[Operator], query: str, base_url: str) -> List[Operator]:
+    """
+    Return the operators whose name or code contains query (case-insensitive).
+
+    The first search of a roster object is a linear scan. If the same object is
+    searched again (it stays cached for _CACHE_TTL, and ETag revalidation
+    returns it unchanged), a trigram index of it is built and reused, so
+    repeated searches only verify the few candidates sharing all of the query's
+    trigrams instead of scanning every record. The index keeps its own snapshot
+    of the operators, so its positions stay valid whatever happens to the
+    roster list afterwards.
+    """
+    query = query.lower()
+    entry = _search_index.get(base_url)
+    if entry is None or entry[0] is not roster:
+        # A roster seen for the first time may never be searched again (e.g. a
+        # backend without ETags), so indexing it would cost more than a scan
+        _search_index[base_url] = (roster, None)
+        return [op for op in roster if query in _search_text(op)]
+    index = entry[1]
+    if index is None:
+        operators = tuple(roster)
+        texts = [_search_text(op) for op in operators]
+        postings: Dict[str, set] = {}
+        for position, text in enumerate(texts):
+            for gram in _trigrams(text):
+                postings.setdefault(gram, set()).add(position)
+        index = (operators, texts, postings)
+        _search_index[base_url] = (roster, index)
+    operators, texts, postings = index
+
+    grams = _trigrams(query)
+    if not grams:
+        candidates = range(len(texts))
+    else:
+        candidate_set = None
+        for gram in sorted(grams, key=lambda g: len(postings.get(g, ()))):
+            matches = postings.get(gram, set())
+            candidate_set = matches if candidate_set is None else candidate_set & matches
+            if not candidate_set:
+                return []
+        candidates = sorted(candidate_set)
+    return [operators[i] for i in candidates if query in texts[i]]
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> Any:
+    """Compile a case-insensitive search pattern, with RE2 when it is installed."""
+    return _regex_engine.compile(f"(?i){pattern}")
+
+
+def _match_operators_regex(roster: List[Operator], pattern: str, base_url: str) -> List[Operator]:
+    """Return the operators whose name or code matches a regular expression."""
+    search = _compile_pattern(pattern).search
+    return [
+        op for op in roster
+        if search(op.get("operatorName") or "") or search(op.get("operatorCode") or "")
+    ]
+
+
+async def search_operators(
+    department: str | None = None,
+    status: str | None = None,
+    base_url: str = DEFAULT_BASE_URL,
+    query: str | None = None,
+    regex: bool = False
 ) -> List[Operator]:
     """
     Search operators with optional filters.
 
-    Client-side filtering helper for operators by department and/or status.
+    Client-side filtering helper for operators by department and/or status, and
+    by a free-text query matched against operator names and codes.
     For large datasets, prefer using dedicated API endpoints when available.
 
     Agent_card:
@@ -872,12 +2263,16 @@ async def search_operators(
     capabilities:
       - Multi-criteria operator search
       - Flexible operator filtering
+      - Find operators by partial name or code
       - Support complex queries
 
     Args:
         department: Optional department filter
         status: Optional status filter (e.g., "Active", "Inactive")
         base_url: Base URL for the API
+        query: Optional case-insensitive substring of the operator name or code
+        regex: Treat query as a regular expression instead of a substring. Matching
+               uses RE2 (linear time) when installed, otherwise the re module
 
     Returns:
         Filtered list of operators
@@ -885,25 +2280,35 @@ async def search_operators(
     Example:
         >>> active_production = await search_operators(department="Production", status="Active")
         >>> print(f"Found {len(active_production)} active production operators")
+        >>> smiths = await search_operators(query="smith")
+        >>> op_codes = await search_operators(query="^OP0[0-9]", regex=True)
     """
-    # Get base dataset
+    if query:
+        # Hold the roster for _CACHE_TTL so that, even on a backend without ETags,
+        # consecutive searches see the same object and can share its index
+        roster = await _cached(("roster", base_url), _get_client(base_url)._get_roster)
+        match = _match_operators_regex if regex else _match_operators
+        return _copy_records([
+            op for op in match(roster, query, base_url)
+            if (not department or op.get("department") == department)
+            and (not status or op.get("status") == status)
+        ])
+
+    # Department has its own endpoint; status-only searches filter the cached roster
     if department:
         operators = await get_operators_by_department(department, base_url)
-    else:
-        operators = await get_all_operators(base_url)
-
-    # Apply additional filters
-    if status:
-        operators = [op for op in operators if op.get("status") == status]
+        if status:
+            operators = [op for op in operators if op.get("status") == status]
+        return operators
 
-    return operators
+    return await _get_client(base_url).get_all_operators(status=status)
 
 
 # ============================================================================
 # Error Handling Example
 # ============================================================================
 
-async def safe_get_operator(operator_id: int, base_url: str = DEFAULT_BASE_URL) -> Optional[Operator]:
+async def safe_get_operator(operator_id: int, base_url: str = DEFAULT_BASE_URL) -> Operator | None:
     """
     Safely get operator by ID with error handling.
 
@@ -922,11 +2327,12 @@ async def safe_get_operator(operator_id: int, base_url: str = DEFAULT_BASE_URL)
         >>> if operator is None:
         ...     print("Operator not found")
     """
+    # A missing operator is reported as a plain 404 status rather than an
+    # HTTPStatusError, so probing for IDs does not pay for exception handling
+    client = _get_client(base_url)
     try:
-        return await get_operator_by_id(operator_id, base_url)
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code == 404:
-            return None
+        return await client._find_operator_by_id(operator_id)
+    except httpx.HTTPStatusError:
         raise
     except httpx.HTTPError:
         return None
@@ -944,6 +2350,17 @@ __all__ = [
     'Equipment',
     'Shift',
 
+    # Record types
+    'OperatorRecord',
+    'LotRecord',
+    'ProductTypeRecord',
+    'EquipmentRecord',
+    'ShiftRecord',
+
+    # Client
+    'AsyncOperatorsClient',
+    'SyncOperatorsClient',
+
     # Core API functions (matching OpenAPI spec)
     'get_operator_by_id',
     'get_all_operators',
@@ -951,11 +2368,26 @@ __all__ = [
     'get_operators_by_department',
     'get_operator_by_code',
 
+    # Streaming functions
+    'iter_all_operators',
+    'iter_operator_lots',
+
     # Utility functions
     'get_operator_summary',
+    'get_operators_by_ids',
+    'get_department_lots',
     'search_operators',
     'safe_get_operator',
 
+    # Connection and cache management
+    'aclose_all',
+    'install_uvloop',
+    'use_client',
+    'invalidate_operator',
+    'clear_cache',
+    'invalidate_cache',
+
     # Configuration
     'DEFAULT_BASE_URL',
+    'HTTP_TIMEOUTS',
 ]
@@ -0,0 +1,832 @@
+"""
+Behaviour tests for the Operators API client.
+
+The API is replaced by an httpx.MockTransport, so no server is needed. Run with
+``python -m pytest`` or ``python -m unittest`` from the repository root.
+"""
+
+import asyncio
+import gc
+import os
+import stat
+import tempfile
+import unittest
+from datetime import date, datetime
+from unittest import mock
+
+import httpx
+
+from src.operators import operators_api as api
+
+
+BASE_URL = "http://mes.test/api/v1"
+
+# OperatorsApiTestCase replaces _retry_delay so retries do not sleep
+retry_delay = api._retry_delay
+
+OPERATORS = [
+    {"operatorId": 1, "operatorCode": "OP001", "operatorName": "Amy Smith",
+     "department": "Production", "status": "Active"},
+    {"operatorId": 2, "operatorCode": "OP002", "operatorName": "Bob Jones",
+     "department": "Production", "status": "Inactive"},
+    {"operatorId": 3, "operatorCode": "OP003", "operatorName": "Cat Smith",
+     "department": "Quality", "status": "Active"},
+    {"operatorId": 4, "operatorCode": "OP004", "operatorName": "Dan Brown",
+     "department": "Quality", "status": "Active"},
+]
+
+
+def lots_of(operator: dict) -> list:
+    """Two lots processed by the operator."""
+    return [
+        {"lotId": operator["operatorId"] * 10 + n, "lotNumber": f"LOT-{n}", "operator": operator,
+         "productionStart": "2024-01-0%dT08:00:00" % (n + 1), "waferCount": 25, "status": "Completed"}
+        for n in range(2)
+    ]
+
+
+class FakeAPI:
+    """Minimal Operators API: records every request it receives."""
+
+    def __init__(self, batch: bool = True, etag: str = '"v1"', delay: float = 0.0):
+        self.batch = batch
+        self.etag = etag
+        self.delay = delay
+        self.requests = []
+
+    def paths(self, method: str = "GET") -> list:
+        return [r.url.path for r in self.requests if r.method == method]
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        path = request.url.path[len("/api/v1"):]
+        if path == "/operators":
+            if self.etag and request.headers.get("If-None-Match") == self.etag:
+                return httpx.Response(304)
+            headers = {"ETag": self.etag} if self.etag else {}
+            return httpx.Response(200, json=OPERATORS, headers=headers)
+        if path == "/operators/batch":
+            if not self.batch:
+                return httpx.Response(405)
+            if request.headers.get("Content-Type") != "application/json":
+                return httpx.Response(415)
+            ids = api._loads(request.content)["ids"]
+            return httpx.Response(200, json=[op for op in OPERATORS if op["operatorId"] in ids])
+        parts = path.strip("/").split("/")
+        if parts[1] == "department":
+            return httpx.Response(200, json=[op for op in OPERATORS if op["department"] == parts[2]])
+        if parts[1] == "code":
+            matches = [op for op in OPERATORS if op["operatorCode"] == parts[2]]
+        else:
+            matches = [op for op in OPERATORS if op["operatorId"] == int(parts[1])]
+        if not matches:
+            return httpx.Response(404, json={"error": "Operator not found"})
+        if parts[-1] == "lots":
+            return httpx.Response(200, json=lots_of(matches[0]))
+        return httpx.Response(200, json=matches[0])
+
+
+class OperatorsApiTestCase(unittest.IsolatedAsyncioTestCase):
+    """Resets module-level caches and routes calls through a FakeAPI."""
+
+    async def asyncSetUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        patches = [
+            mock.patch.object(api, "_DISK_CACHE_DIR", self.cache_dir.name),
+            mock.patch.object(api, "_retry_delay", lambda *args, **kwargs: 0),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        api.clear_cache()
+        api._inflight.clear()
+        api._search_index.clear()
+        api._BATCH_UNSUPPORTED.clear()
+
+        self.fake = FakeAPI()
+        self.http = httpx.AsyncClient(transport=httpx.MockTransport(self.fake))
+        self.client = api.AsyncOperatorsClient(BASE_URL, client=self.http)
+        self.client_context = api.use_client(self.http)
+        self.client_context.__enter__()
+
+    async def asyncTearDown(self):
+        self.client_context.__exit__(None, None, None)
+        await self.http.aclose()
+
+
+# ============================================================================
+# Request coalescing and caching
+# ============================================================================
+
+class CoalesceTests(OperatorsApiTestCase):
+
+    async def test_concurrent_callers_share_one_call(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*[api._coalesce(("k",), fetch) for _ in range(5)])
+        self.assertEqual(results, ["result"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertNotIn(("k",), api._inflight)
+
+    async def test_failure_reaches_every_caller_and_is_not_kept(self):
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            *[api._coalesce(("k",), fetch) for _ in range(3)], return_exceptions=True
+        )
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertNotIn(("k",), api._inflight)
+
+    async def test_cancelled_caller_does_not_cancel_the_others(self):
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return "result"
+
+        first = asyncio.ensure_future(api._coalesce(("k",), fetch))
+        second = asyncio.ensure_future(api._coalesce(("k",), fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        self.assertEqual(await second, "result")
+
+    async def test_duplicate_operator_lookups_issue_one_request(self):
+        self.fake.delay = 0.01
+        operators = await asyncio.gather(*[self.client.get_operator_by_id(1) for _ in range(5)])
+        self.assertEqual({op["operatorId"] for op in operators}, {1})
+        self.assertEqual(len(self.fake.requests), 1)
+
+    async def test_failure_after_all_waiters_cancelled_is_not_logged(self):
+        loop = asyncio.get_running_loop()
+        errors = []
+        loop.set_exception_handler(lambda _, context: errors.append(context))
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        waiter = asyncio.ensure_future(api._coalesce(("k",), fetch))
+        await asyncio.sleep(0)
+        shared = api._inflight[("k",)]
+        waiter.cancel()
+        await asyncio.wait([shared])
+        del shared
+        gc.collect()
+        await asyncio.sleep(0)
+        self.assertEqual(errors, [])
+
+
+class CachedTests(OperatorsApiTestCase):
+
+    async def test_hit_within_ttl_skips_the_factory(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            return {"value": len(calls)}
+
+        self.assertEqual(await api._cached(("k",), fetch), {"value": 1})
+        self.assertEqual(await api._cached(("k",), fetch), {"value": 1})
+        self.assertEqual(len(calls), 1)
+
+    async def test_expired_entry_is_fetched_again(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            return {"value": len(calls)}
+
+        await api._cached(("k",), fetch)
+        later = api.time.monotonic() + api._CACHE_TTL + 1
+        with mock.patch.object(api.time, "monotonic", return_value=later):
+            self.assertEqual(await api._cached(("k",), fetch), {"value": 2})
+        self.assertEqual(len(calls), 2)
+
+    async def test_operator_cached_under_id_and_code(self):
+        await self.client.get_operator_by_id(1)
+        operator = await self.client.get_operator_by_code("OP001")
+        self.assertEqual(operator["operatorId"], 1)
+        by_code = await self.client.get_operator_by_code("OP002")
+        self.assertEqual((await self.client.get_operator_by_id(2))["operatorCode"], by_code["operatorCode"])
+        self.assertEqual(len(self.fake.requests), 2)
+
+    async def test_invalidate_operator_drops_the_code_entry(self):
+        await self.client.get_operator_by_code("OP001")
+        api.invalidate_operator(1)
+        await self.client.get_operator_by_code("OP001")
+        self.assertEqual(len(self.fake.requests), 2)
+
+    async def test_invalidate_operator_forces_refetch(self):
+        await self.client.get_operator_by_id(1)
+        api.invalidate_operator(1)
+        await self.client.get_operator_by_id(1)
+        self.assertEqual(len(self.fake.requests), 2)
+
+    async def test_editing_a_returned_operator_does_not_change_the_cache(self):
+        operator = await api.get_operator_by_id(1, BASE_URL)
+        operator["operatorName"] = "CHANGED"
+        self.assertEqual((await api.get_operator_by_id(1, BASE_URL))["operatorName"], "Amy Smith")
+        self.assertEqual((await api.get_operator_by_code("OP001", BASE_URL))["operatorName"], "Amy Smith")
+
+        summary = await api.get_operator_summary(1, BASE_URL)
+        summary["operator"]["operatorName"] = "CHANGED"
+        self.assertEqual((await api.get_operator_by_id(1, BASE_URL))["operatorName"], "Amy Smith")
+        self.assertEqual(len(self.fake.paths()), 2)  # operator once, lots once
+
+    async def test_editing_a_returned_roster_does_not_affect_search(self):
+        roster = await api.get_all_operators(BASE_URL)
+        for op in roster:
+            op["operatorName"] = "CHANGED"
+        smiths = await api.search_operators(query="smith", base_url=BASE_URL)
+        self.assertEqual([op["operatorName"] for op in smiths], ["Amy Smith", "Cat Smith"])
+
+        department = await api.get_operators_by_department("Quality", BASE_URL)
+        department[0]["status"] = "CHANGED"
+        again = await api.get_operators_by_department("Quality", BASE_URL)
+        self.assertEqual(again[0]["status"], "Active")
+
+    async def test_editing_search_results_does_not_change_the_cache(self):
+        for op in await api.search_operators(query="smith", base_url=BASE_URL):
+            op["operatorName"] = "CHANGED"
+        smiths = await api.search_operators(query="smith", base_url=BASE_URL)
+        self.assertEqual([op["operatorName"] for op in smiths], ["Amy Smith", "Cat Smith"])
+        roster = await api.get_all_operators(BASE_URL)
+        self.assertEqual(roster[0]["operatorName"], "Amy Smith")
+
+
+# ============================================================================
+# Caller-supplied clients
+# ============================================================================
+
+class BorrowedClientTests(OperatorsApiTestCase):
+
+    async def test_requests_ignore_the_borrowed_clients_base_url(self):
+        async with httpx.AsyncClient(
+            base_url="https://auth.internal/v2", transport=httpx.MockTransport(self.fake)
+        ) as http:
+            with api.use_client(http):
+                operator = await api.get_operator_by_id(1, BASE_URL)
+        self.assertEqual(operator["operatorId"], 1)
+        self.assertEqual(str(self.fake.requests[0].url), BASE_URL + "/operators/1")
+
+    async def test_borrowed_requests_carry_the_default_headers(self):
+        await api.get_operator_by_id(1, BASE_URL)
+        await api.get_all_operators(BASE_URL)
+        for request in self.fake.requests:
+            self.assertEqual(request.headers["Accept"], "application/json")
+            self.assertEqual(request.headers["User-Agent"], f"sam-operators/{api.__version__}")
+
+    async def test_json_body_is_sent_with_a_single_content_type(self):
+        await api.get_operators_by_ids([1], BASE_URL)
+        post = self.fake.requests[0]
+        self.assertEqual(post.headers.get_list("Content-Type"), ["application/json"])
+
+
+# ============================================================================
+# Streaming
+# ============================================================================
+
+class StreamingTests(OperatorsApiTestCase):
+
+    async def test_iter_all_operators_yields_every_operator(self):
+        ids = [op["operatorId"] async for op in api.iter_all_operators(BASE_URL)]
+        self.assertEqual(ids, [op["operatorId"] for op in OPERATORS])
+
+    async def test_iter_operator_lots_yields_every_lot(self):
+        lots = [lot async for lot in api.iter_operator_lots(1, BASE_URL)]
+        self.assertEqual([lot["lotId"] for lot in lots], [10, 11])
+
+    async def test_calls_inside_the_loop_do_not_wait_on_the_stream(self):
+        with mock.patch.object(api, "_MAX_CONCURRENCY", 1):
+            async def consume():
+                return [
+                    len(await api.get_operator_lots(op["operatorId"], BASE_URL))
+                    async for op in api.iter_all_operators(BASE_URL)
+                ]
+            counts = await asyncio.wait_for(consume(), 2)
+        self.assertEqual(counts, [2] * len(OPERATORS))
+
+    async def test_stopping_early_closes_the_stream(self):
+        async for _ in api.iter_all_operators(BASE_URL):
+            break
+        self.assertFalse(api._get_semaphore().locked())
+
+    async def test_transient_failure_is_retried_before_streaming(self):
+        responses = iter([httpx.Response(503), httpx.Response(200, json=OPERATORS)])
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: next(responses))
+        ) as http:
+            client = api.AsyncOperatorsClient(BASE_URL, client=http)
+            ids = [op["operatorId"] async for op in client.iter_all_operators()]
+        self.assertEqual(len(ids), len(OPERATORS))
+
+
+# ============================================================================
+# Retries
+# ============================================================================
+
+class RetryTests(OperatorsApiTestCase):
+
+    async def test_connection_error_is_tried_max_attempts_times(self):
+        attempts = []
+
+        def refuse(request):
+            attempts.append(request)
+            raise httpx.ConnectError("connection refused", request=request)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(refuse)) as http:
+            client = api.AsyncOperatorsClient(BASE_URL, client=http)
+            with self.assertRaises(httpx.ConnectError):
+                await client.get_operator_by_id(1)
+        self.assertEqual(len(attempts), api._MAX_ATTEMPTS)
+
+    async def test_refused_port_fails_without_transport_retries(self):
+        client = api.AsyncOperatorsClient("http://127.0.0.1:9/api/v1")
+        started = api.time.monotonic()
+        with self.assertRaises(httpx.ConnectError):
+            await client.get_operator_by_id(1)
+        await client.aclose()
+        self.assertLess(api.time.monotonic() - started, 1.0)
+
+    async def test_server_error_is_retried(self):
+        responses = iter([httpx.Response(503), httpx.Response(200, json=OPERATORS[0])])
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: next(responses))
+        ) as http:
+            client = api.AsyncOperatorsClient(BASE_URL, client=http)
+            self.assertEqual((await client.get_operator_by_id(1))["operatorId"], 1)
+
+    async def test_client_error_is_not_retried(self):
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.client.get_operator_by_id(99)
+        self.assertEqual(len(self.fake.requests), 1)
+
+    async def test_last_failure_is_raised(self):
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(503))
+        ) as http:
+            client = api.AsyncOperatorsClient(BASE_URL, client=http)
+            with self.assertRaises(httpx.HTTPStatusError):
+                await client.get_operator_by_id(1)
+
+    async def test_retry_after_is_honoured(self):
+        responses = iter([
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(200, json=OPERATORS[0]),
+        ])
+        delays = []
+
+        def record(attempt, retry_after=None):
+            delays.append(retry_delay(attempt, retry_after))
+            return 0
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: next(responses))
+        ) as http:
+            client = api.AsyncOperatorsClient(BASE_URL, client=http)
+            with mock.patch.object(api, "_retry_delay", record):
+                await client.get_operator_by_id(1)
+        self.assertEqual(delays, [3.0])
+
+
+class RetryDelayTests(unittest.TestCase):
+
+    def test_backoff_doubles_up_to_the_cap(self):
+        delays = [retry_delay(attempt) for attempt in range(8)]
+        self.assertEqual(delays[:3], [api._RETRY_BACKOFF * n for n in (1, 2, 4)])
+        self.assertEqual(delays[-1], api._RETRY_MAX_BACKOFF)
+
+    def test_retry_after_is_clamped(self):
+        self.assertEqual(retry_delay(0, "120"), api._RETRY_AFTER_MAX)
+        self.assertEqual(retry_delay(0, "-1"), 0.0)
+
+    def test_http_date_retry_after_falls_back_to_backoff(self):
+        self.assertEqual(retry_delay(1, "Wed, 21 Oct 2015 07:28:00 GMT"), api._RETRY_BACKOFF * 2)
+
+
+# ============================================================================
+# Status filtering
+# ============================================================================
+
+class StatusFilterTests(OperatorsApiTestCase):
+
+    async def test_status_is_filtered_client_side(self):
+        inactive = await self.client.get_all_operators(status="Inactive")
+        self.assertEqual([op["operatorId"] for op in inactive], [2])
+        self.assertEqual([str(r.url) for r in self.fake.requests], [BASE_URL + "/operators"])
+
+    async def test_status_search_uses_the_cached_roster(self):
+        await api.get_all_operators(BASE_URL)
+        active = await api.search_operators(status="Active", base_url=BASE_URL)
+        self.assertEqual([op["operatorId"] for op in active], [1, 3, 4])
+        self.assertEqual(self.fake.requests[-1].headers.get("If-None-Match"), '"v1"')
+
+    async def test_concurrent_status_searches_share_one_request(self):
+        self.fake.delay = 0.01
+        await asyncio.gather(
+            api.search_operators(status="Active", base_url=BASE_URL),
+            api.search_operators(status="Inactive", base_url=BASE_URL),
+        )
+        self.assertEqual(len(self.fake.requests), 1)
+
+    async def test_department_and_status_are_combined(self):
+        found = await api.search_operators(department="Production", status="Active", base_url=BASE_URL)
+        self.assertEqual([op["operatorId"] for op in found], [1])
+
+
+# ============================================================================
+# Search
+# ============================================================================
+
+class SearchOperatorsTests(OperatorsApiTestCase):
+
+    async def test_query_matches_name_or_code(self):
+        smiths = await api.search_operators(query="smith", base_url=BASE_URL)
+        self.assertEqual([op["operatorName"] for op in smiths], ["Amy Smith", "Cat Smith"])
+        by_code = await api.search_operators(query="op004", base_url=BASE_URL)
+        self.assertEqual([op["operatorId"] for op in by_code], [4])
+
+    async def test_query_combines_with_filters(self):
+        found = await api.search_operators(
+            department="Quality", status="Active", query="smith", base_url=BASE_URL
+        )
+        self.assertEqual([op["operatorId"] for op in found], [3])
+
+    async def test_regex_query(self):
+        found = await api.search_operators(query=r"^OP00[12]$", regex=True, base_url=BASE_URL)
+        self.assertEqual([op["operatorId"] for op in found], [1, 2])
+        anchored = await api.search_operators(query=r"^cat|brown$", regex=True, base_url=BASE_URL)
+        self.assertEqual([op["operatorId"] for op in anchored], [3, 4])
+
+    async def test_invalid_regex_is_raised(self):
+        with self.assertRaises(api._regex_engine.error):
+            await api.search_operators(query="(unclosed", regex=True, base_url=BASE_URL)
+
+    async def test_indexed_search_matches_the_scan(self):
+        for query in ["smith", "SMITH", "op00", "b", "zz", "n\x00op", "Dan Brown"]:
+            api._search_index.clear()
+            scanned = await api.search_operators(query=query, base_url=BASE_URL)
+            indexed = await api.search_operators(query=query, base_url=BASE_URL)
+            self.assertIsNotNone(api._search_index[BASE_URL][1])
+            self.assertEqual(indexed, scanned, query)
+
+    async def test_roster_is_indexed_only_when_searched_again(self):
+        await api.search_operators(query="smith", base_url=BASE_URL)
+        self.assertIsNone(api._search_index[BASE_URL][1])
+        await api.search_operators(query="jones", base_url=BASE_URL)
+        self.assertIsNotNone(api._search_index[BASE_URL][1])
+
+    async def test_searches_without_etags_share_the_cached_roster(self):
+        self.fake.etag = None
+        for query in ["smith", "jones", "brown"]:
+            await api.search_operators(query=query, base_url=BASE_URL)
+        self.assertEqual(len(self.fake.requests), 1)
+        self.assertIsNotNone(api._search_index[BASE_URL][1])
+
+    async def test_mutating_a_returned_roster_does_not_affect_search(self):
+        await api.search_operators(query="smith", base_url=BASE_URL)
+        roster = await api.get_all_operators(BASE_URL)
+        roster.sort(key=lambda op: op["operatorName"], reverse=True)
+        smiths = await api.search_operators(query="smith", base_url=BASE_URL)
+        self.assertEqual([op["operatorName"] for op in smiths], ["Amy Smith", "Cat Smith"])
+
+
+# ============================================================================
+# Persistent roster cache
+# ============================================================================
+
+class DiskCacheTests(OperatorsApiTestCase):
+
+    async def test_disk_validator_survives_restart_and_is_kept_in_memory(self):
+        await self.client._get_conditional(api._OPERATORS_PATH, "get_all_operators", persist=True)
+        api.clear_cache()  # simulates a restart: only the disk cache remains
+
+        with mock.patch.object(api, "_read_disk_entry", wraps=api._read_disk_entry) as read:
+            for _ in range(3):
+                body = await self.client._get_conditional(
+                    api._OPERATORS_PATH, "get_all_operators", persist=True
+                )
+        self.assertEqual(body, OPERATORS)
+        self.assertEqual(read.call_count, 1)
+        self.assertEqual(self.fake.requests[1].headers.get("If-None-Match"), '"v1"')
+
+    async def test_invalidate_cache_removes_only_cache_files(self):
+        await self.client._get_conditional(api._OPERATORS_PATH, "get_all_operators", persist=True)
+        unrelated = os.path.join(self.cache_dir.name, "settings.json")
+        with open(unrelated, "w") as f:
+            f.write("{}")
+
+        api.invalidate_cache()
+        self.assertEqual(os.listdir(self.cache_dir.name), ["settings.json"])
+
+    @unittest.skipIf(os.name != "posix", "POSIX permissions")
+    async def test_cache_is_private_to_the_user(self):
+        cache_dir = os.path.join(self.cache_dir.name, "roster")
+        with mock.patch.object(api, "_DISK_CACHE_DIR", cache_dir):
+            await api.get_all_operators(BASE_URL)
+            path = api._disk_cache_path(BASE_URL, api._OPERATORS_PATH)
+        self.assertEqual(stat.S_IMODE(os.stat(cache_dir).st_mode) & 0o077, 0)
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o600)
+
+
+# ============================================================================
+# Timeouts
+# ============================================================================
+
+class TimeoutTests(OperatorsApiTestCase):
+
+    async def test_requests_use_the_skill_timeout_by_default(self):
+        await self.client.get_operator_by_id(1)
+        await self.client.get_operator_lots(1)
+        by_id, lots = [r.extensions["timeout"] for r in self.fake.requests]
+        self.assertEqual(by_id, api.HTTP_TIMEOUTS["get_operator_by_id"].as_dict())
+        self.assertEqual(lots, api.HTTP_TIMEOUTS["get_operator_lots"].as_dict())
+
+    async def test_client_timeout_overrides_every_skill(self):
+        client = api.AsyncOperatorsClient(BASE_URL, timeout=60, client=self.http)
+        await client.get_operator_by_id(1)
+        timeout = self.fake.requests[0].extensions["timeout"]
+        self.assertEqual(timeout["read"], 60)
+        self.assertEqual(timeout["connect"], api._CONNECT_TIMEOUT)
+
+    async def test_timeout_is_raised_without_retrying(self):
+        attempts = []
+
+        def time_out(request):
+            attempts.append(request)
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(time_out)) as http:
+            client = api.AsyncOperatorsClient(BASE_URL, client=http)
+            with self.assertRaises(httpx.ReadTimeout):
+                await client.get_operator_by_id(1)
+        self.assertEqual(len(attempts), 1)
+
+
+class SkillTimeoutTests(unittest.TestCase):
+
+    def test_env_var_overrides_the_default(self):
+        with mock.patch.dict(os.environ, {"OPERATORS_TIMEOUT_GET_OPERATOR_LOTS": "60"}):
+            timeout = api._skill_timeout("get_operator_lots", 20.0)
+        self.assertEqual((timeout.read, timeout.connect), (60.0, 2.0))
+
+    def test_malformed_env_var_keeps_the_default(self):
+        with mock.patch.dict(os.environ, {"OPERATORS_TIMEOUT_GET_OPERATOR_LOTS": "30s"}):
+            with self.assertLogs(api._logger, "WARNING"):
+                timeout = api._skill_timeout("get_operator_lots", 20.0)
+        self.assertEqual(timeout.read, 20.0)
+
+
+# ============================================================================
+# Conditional GETs
+# ============================================================================
+
+class ConditionalGetTests(OperatorsApiTestCase):
+
+    async def test_not_modified_returns_previous_body(self):
+        first = await self.client._get_conditional(api._OPERATORS_PATH, "get_all_operators")
+        second = await self.client._get_conditional(api._OPERATORS_PATH, "get_all_operators")
+        self.assertIs(second, first)
+        self.assertIsNone(self.fake.requests[0].headers.get("If-None-Match"))
+        self.assertEqual(self.fake.requests[1].headers.get("If-None-Match"), '"v1"')
+
+    async def test_response_without_etag_is_not_revalidated(self):
+        self.fake.etag = ""
+        await self.client._get_conditional(api._OPERATORS_PATH, "get_all_operators")
+        await self.client._get_conditional(api._OPERATORS_PATH, "get_all_operators")
+        self.assertIsNone(self.fake.requests[1].headers.get("If-None-Match"))
+
+    async def test_returned_roster_is_a_copy(self):
+        roster = await api.get_all_operators(BASE_URL)
+        roster.clear()
+        self.assertEqual(len(await api.get_all_operators(BASE_URL)), len(OPERATORS))
+
+
+# ============================================================================
+# Batch lookups
+# ============================================================================
+
+class GetOperatorsByIdsTests(OperatorsApiTestCase):
+
+    async def test_batch_endpoint_keeps_order_and_marks_missing_ids(self):
+        operators = await api.get_operators_by_ids([3, 99, 1], BASE_URL)
+        self.assertEqual([op and op["operatorId"] for op in operators], [3, None, 1])
+        self.assertEqual(self.fake.paths("POST"), ["/api/v1/operators/batch"])
+        self.assertEqual(self.fake.paths("GET"), [])
+
+    async def test_empty_ids_issue_no_request(self):
+        self.assertEqual(await api.get_operators_by_ids([], BASE_URL), [])
+        self.assertEqual(self.fake.requests, [])
+
+    async def test_server_error_is_raised(self):
+        async def failing(request):
+            return httpx.Response(500)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(failing)) as http:
+            client = api.AsyncOperatorsClient(BASE_URL, client=http)
+            with self.assertRaises(httpx.HTTPStatusError):
+                await client.get_operators_by_ids([1])
+        self.assertNotIn(BASE_URL, api._BATCH_UNSUPPORTED)
+
+    async def test_falls_back_to_concurrent_gets_when_batch_is_unsupported(self):
+        self.fake.batch = False
+        operators = await api.get_operators_by_ids(iter([2, 99, 2]), BASE_URL)
+        self.assertEqual([op and op["operatorId"] for op in operators], [2, None, 2])
+        self.assertEqual(sorted(self.fake.paths("GET")), ["/api/v1/operators/2", "/api/v1/operators/99"])
+
+        # Support is probed once per base URL
+        await api.get_operators_by_ids([1], BASE_URL)
+        self.assertEqual(len(self.fake.paths("POST")), 1)
+
+    async def test_fallback_bounds_concurrent_gets(self):
+        self.fake.batch = False
+        in_flight = peak = 0
+        handle = self.fake.__call__
+
+        async def counting(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            try:
+                return await handle(request)
+            finally:
+                in_flight -= 1
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(counting)) as http:
+            client = api.AsyncOperatorsClient(BASE_URL, client=http)
+            with mock.patch.object(api, "_BATCH_FALLBACK_CONCURRENCY", 3):
+                operators = await client.get_operators_by_ids(range(1, 11))
+        self.assertEqual(sum(op is not None for op in operators), len(OPERATORS))
+        self.assertEqual(peak, 3)
+
+
+# ============================================================================
+# Shared clients
+# ============================================================================
+
+class SharedClientTests(unittest.TestCase):
+
+    def test_each_event_loop_gets_its_own_shared_client(self):
+        async def shared_clients():
+            clients = api._get_client(BASE_URL), api._get_client(BASE_URL)
+            await api.aclose_all()
+            return clients
+
+        first, again = asyncio.run(shared_clients())
+        second, _ = asyncio.run(shared_clients())
+        self.assertIs(first, again)
+        self.assertIsNot(first, second)
+
+    def test_each_base_url_gets_its_own_shared_client(self):
+        async def shared_clients():
+            clients = api._get_client(BASE_URL), api._get_client("http://other.test/api/v1")
+            await api.aclose_all()
+            return clients
+
+        first, other = asyncio.run(shared_clients())
+        self.assertIsNot(first, other)
+
+
+# ============================================================================
+# Error handling
+# ============================================================================
+
+class SafeGetOperatorTests(OperatorsApiTestCase):
+
+    async def test_existing_operator_is_returned(self):
+        operator = await api.safe_get_operator(1, BASE_URL)
+        self.assertEqual(operator["operatorName"], "Amy Smith")
+
+    async def test_missing_operator_is_none(self):
+        self.assertIsNone(await api.safe_get_operator(99, BASE_URL))
+        self.assertEqual(len(self.fake.requests), 1)
+
+    async def test_connection_failure_is_none(self):
+        def refuse(request):
+            raise httpx.ConnectError("connection refused", request=request)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(refuse)) as http:
+            with api.use_client(http):
+                self.assertIsNone(await api.safe_get_operator(1, BASE_URL))
+
+    async def test_server_error_is_raised(self):
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(500))
+        ) as http:
+            with api.use_client(http):
+                with self.assertRaises(httpx.HTTPStatusError):
+                    await api.safe_get_operator(1, BASE_URL)
+
+
+# ============================================================================
+# Records
+# ============================================================================
+
+class RecordTests(OperatorsApiTestCase):
+
+    async def test_as_objects_returns_records(self):
+        operators = await api.get_all_operators(BASE_URL, as_objects=True)
+        self.assertTrue(all(isinstance(op, api.OperatorRecord) for op in operators))
+        self.assertEqual([op.operatorName for op in operators], [op["operatorName"] for op in OPERATORS])
+
+    async def test_lots_nest_operator_records(self):
+        lots = await api.get_operator_lots(1, BASE_URL, as_objects=True)
+        self.assertTrue(all(isinstance(lot, api.LotRecord) for lot in lots))
+        self.assertEqual(lots[0].operator, api.OperatorRecord.from_dict(OPERATORS[0]))
+
+    def test_records_are_slotted_and_frozen(self):
+        record = api.OperatorRecord.from_dict(OPERATORS[0])
+        self.assertFalse(hasattr(record, "__dict__"))
+        with self.assertRaises(AttributeError):
+            record.status = "Inactive"
+
+    def test_temporal_fields_are_parsed(self):
+        record = api.OperatorRecord.from_dict({
+            **OPERATORS[0], "hireDate": "2020-03-15", "createdAt": "2024-01-02T08:30:00"
+        })
+        self.assertEqual(record.hireDate, date(2020, 3, 15))
+        self.assertEqual(record.createdAt, datetime(2024, 1, 2, 8, 30))
+
+        lot = api.LotRecord.from_dict(lots_of(OPERATORS[0])[1])
+        self.assertEqual(lot.productionStart, datetime(2024, 1, 2, 8, 0))
+        self.assertIsNone(lot.productionEnd)
+
+    def test_msgspec_matches_the_pure_python_path(self):
+        items = [{**OPERATORS[0], "hireDate": "2020-03-15", "createdAt": "2024-01-02T08:30:00"}]
+        converted = api._to_records(items, api.OperatorRecord)
+        with mock.patch.object(api, "msgspec", None):
+            self.assertEqual(api._to_records(items, api.OperatorRecord), converted)
+        lots = lots_of(OPERATORS[0])
+        with mock.patch.object(api, "msgspec", None):
+            expected = api._to_records(lots, api.LotRecord)
+        self.assertEqual(api._to_records(lots, api.LotRecord), expected)
+
+    def test_items_msgspec_rejects_fall_back_to_from_dict(self):
+        items = [{**OPERATORS[0], "operatorId": "not-a-number"}]
+        records = api._to_records(items, api.OperatorRecord)
+        self.assertEqual(records[0].operatorId, "not-a-number")
+
+    def test_unknown_fields_are_ignored(self):
+        record = api.OperatorRecord.from_dict({**OPERATORS[0], "badgeColour": "blue"})
+        self.assertEqual(record.operatorId, 1)
+
+
+# ============================================================================
+# Blocking client
+# ============================================================================
+
+class SyncOperatorsClientTests(unittest.TestCase):
+
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patch = mock.patch.object(api, "_DISK_CACHE_DIR", cache_dir.name)
+        patch.start()
+        self.addCleanup(patch.stop)
+        api.clear_cache()
+        api._inflight.clear()
+
+        self.fake = FakeAPI()
+        with mock.patch.object(
+            api.httpx, "AsyncHTTPTransport", lambda **kwargs: httpx.MockTransport(self.fake)
+        ):
+            self.client = api.SyncOperatorsClient(BASE_URL)
+        self.addCleanup(self.client.close)
+
+    def test_calls_return_results(self):
+        self.assertEqual(self.client.get_operator_by_id(1)["operatorName"], "Amy Smith")
+        self.assertEqual(len(self.client.get_all_operators()), len(OPERATORS))
+        self.assertEqual([op["operatorId"] for op in self.client.get_all_operators(status="Inactive")], [2])
+        lots = self.client.get_operator_lots(1, as_objects=True)
+        self.assertTrue(all(isinstance(lot, api.LotRecord) for lot in lots))
+
+    def test_calls_share_one_background_loop(self):
+        loop, thread = self.client._loop, self.client._thread
+        self.client.get_operator_by_id(1)
+        self.client.get_operator_lots(1)
+        self.assertIs(self.client._loop, loop)
+        self.assertTrue(thread.is_alive())
+        self.assertEqual(len(self.fake.requests), 2)
+
+    def test_errors_are_raised_to_the_caller(self):
+        with self.assertRaises(httpx.HTTPStatusError):
+            self.client.get_operator_by_id(99)
+
+    def test_close_stops_the_loop_and_is_idempotent(self):
+        self.client.close()
+        self.client.close()
+        self.assertTrue(self.client._loop.is_closed())
+        self.assertFalse(self.client._thread.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()